@@ -6,22 +6,33 @@ Provides secure login functionality to protect financial data
 import streamlit as st
 import hashlib
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet
 import time
 
 
+# Permissions by role
+_ROLE_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    'admin': frozenset({'view', 'edit', 'delete', 'export', 'import', 'manage_users'}),
+    'manager': frozenset({'view', 'edit', 'export', 'import'}),
+    'viewer': frozenset({'view', 'export'})
+}
+
+
 class AuthManager:
     """Manages user authentication and session security"""
     
+    __slots__ = ('session_timeout', 'max_login_attempts', 'lockout_duration')
+    
     def __init__(self):
         self.session_timeout = 3600  # 1 hour in seconds
         self.max_login_attempts = 3
         self.lockout_duration = 300  # 5 minutes in seconds
         
     def hash_password(self, password: str) -> str:
-        """Hash password using SHA-256 with salt"""
+        """Hash password using BLAKE2b keyed with the salt"""
         salt = os.getenv('AUTH_SALT', 'seas_financial_tracker_2024')
-        return hashlib.sha256((password + salt).encode()).hexdigest()
+        # BLAKE2b accepts keys up to 64 bytes
+        return hashlib.blake2b(password.encode(), key=salt.encode()[:64], digest_size=32).hexdigest()
     
     def get_credentials(self) -> Dict[str, str]:
         """Get valid credentials from environment variables"""
@@ -113,16 +124,7 @@ class AuthManager:
         if not self.is_authenticated():
             return False
             
-        role = self.get_user_role()
-        
-        # Define permissions by role
-        permissions = {
-            'admin': ['view', 'edit', 'delete', 'export', 'import', 'manage_users'],
-            'manager': ['view', 'edit', 'export', 'import'],
-            'viewer': ['view', 'export']
-        }
-        
-        return action in permissions.get(role, [])
+        return action in _ROLE_PERMISSIONS.get(self.get_user_role(), frozenset())
 
 
 def render_login_page() -> bool:
@@ -33,8 +33,20 @@ def apply_theme_to_chart(fig: go.Figure) -> go.Figure:
     return fig
 
 
+def _error_figure(message: str) -> go.Figure:
+    """Create a figure that reports a chart error"""
+    fig = go.Figure()
+    fig.add_annotation(text=f"Chart Error: {message}", xref="paper", yref="paper", 
+                      x=0.5, y=0.5, showarrow=False, font_size=16)
+    fig.update_layout(title="Chart Error")
+    return fig
+
+
 def create_revenue_trends_chart(employees_df: pd.DataFrame, subcontractors_df: pd.DataFrame) -> go.Figure:
     """Create revenue trends chart for employees and subcontractors"""
+    if not isinstance(employees_df, pd.DataFrame) or not isinstance(subcontractors_df, pd.DataFrame):
+        return _error_figure("expected employee and subcontractor DataFrames")
+    
     try:
         # Get time period columns
         time_periods = [col for col in employees_df.columns if col.startswith('Revenue_')]
@@ -114,29 +126,46 @@ def create_revenue_trends_chart(employees_df: pd.DataFrame, subcontractors_df: p
         
     except Exception as e:
         # Return a simple error chart
-        fig = go.Figure()
-        fig.add_annotation(text=f"Chart Error: {str(e)}", xref="paper", yref="paper", 
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        fig.update_layout(title="Chart Error")
-        return fig
+        return _error_figure(str(e))
+
+
+def _reuse_figure(fig: Optional[go.Figure]) -> go.Figure:
+    """Clear traces and annotations from an existing figure, or create a new one"""
+    if fig is None:
+        return go.Figure()
+    fig.data = []
+    fig.layout.annotations = []
+    return fig
+
+
+def _add_empty_annotation(fig: go.Figure, message: str) -> go.Figure:
+    """Add the centered empty-data annotation to a figure"""
+    fig.add_annotation(text=message, xref="paper", yref="paper", 
+                      x=0.5, y=0.5, showarrow=False, font_size=16)
+    return fig
 
 
-def create_employee_heatmap_chart(employees_df: pd.DataFrame) -> go.Figure:
-    """Create employee hours heatmap chart"""
+def _empty_figure(message: str) -> go.Figure:
+    """Build a new annotated figure for empty data; callers may theme or update it freely"""
+    return _add_empty_annotation(go.Figure(), message)
+
+
+def create_employee_heatmap_chart(employees_df: pd.DataFrame, fig: Optional[go.Figure] = None) -> go.Figure:
+    """Create employee hours heatmap chart, updating ``fig`` in place when given"""
     if employees_df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No employee data available", xref="paper", yref="paper", 
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
+        if fig is None:
+            return _empty_figure("No employee data available")
+        return _add_empty_annotation(_reuse_figure(fig), "No employee data available")
     
     # Get time period columns
     hours_cols = [col for col in employees_df.columns if col.startswith('Hours_') and col != 'Hours_Per_Month']
     
     if not hours_cols:
-        fig = go.Figure()
-        fig.add_annotation(text="No hours data available", xref="paper", yref="paper", 
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
+        if fig is None:
+            return _empty_figure("No hours data available")
+        return _add_empty_annotation(_reuse_figure(fig), "No hours data available")
+    
+    fig = _reuse_figure(fig)
     
     # Prepare data for heatmap
     employees = employees_df['Name'].tolist()
@@ -151,7 +180,7 @@ def create_employee_heatmap_chart(employees_df: pd.DataFrame) -> go.Figure:
         hours_matrix.append(row)
     
     # Create heatmap
-    fig = go.Figure(data=go.Heatmap(
+    fig.add_trace(go.Heatmap(
         z=hours_matrix,
         x=periods,
         y=employees,
@@ -177,10 +206,7 @@ def create_employee_heatmap_chart(employees_df: pd.DataFrame) -> go.Figure:
 def create_lcat_cost_analysis_chart(employees_df: pd.DataFrame) -> go.Figure:
     """Create LCAT cost analysis chart"""
     if employees_df.empty:
-        fig = go.Figure()
-        fig.add_annotation(text="No employee data available", xref="paper", yref="paper", 
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
+        return _empty_figure("No employee data available")
     
     # Group by LCAT and calculate costs
     lcat_costs = employees_df.groupby('LCAT').agg({
@@ -221,10 +247,7 @@ def create_burn_rate_chart(employees_df: pd.DataFrame, subcontractors_df: pd.Dat
     time_periods = [col for col in employees_df.columns if col.startswith('Hours_') and col != 'Hours_Per_Month']
     
     if not time_periods:
-        fig = go.Figure()
-        fig.add_annotation(text="No time period data available", xref="paper", yref="paper", 
-                          x=0.5, y=0.5, showarrow=False, font_size=16)
-        return fig
+        return _empty_figure("No time period data available")
     
     # Calculate cumulative hours and costs
     cumulative_hours = []
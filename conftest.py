@@ -0,0 +1,8 @@
+"""
+Root pytest configuration: puts the project root on the import path once
+"""
+
+import sys
+import pathlib
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent))
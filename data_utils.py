@@ -10,32 +10,24 @@ from typing import Dict, List, Tuple, Optional, Any
 import streamlit as st
 
 
-def generate_time_periods() -> List[str]:
-    """Generate monthly time periods for Base Year and Option Year 1"""
-    periods = []
-    
-    # Base Year periods (March 2024 - March 2025)
-    base_year_periods = [
-        "03/13/2024-04/11/2024", "04/12/2024-05/11/2024", "05/12/2024-06/10/2024", "06/11/2024-07/10/2024",
-        "07/11/2024-08/09/2024", "08/10/2024-09/08/2024", "09/09/2024-10/08/2024", "10/09/2024-11/07/2024",
-        "11/08/2024-12/07/2024", "12/08/2024-01/06/2025", "01/07/2025-02/05/2025", "02/06/2025-03/07/2025"
-    ]
-    
-    # Option Year 1 periods (March 2025 - March 2026)
-    option_year_periods = [
-        "03/08/2025-04/07/2025", "04/08/2025-05/07/2025", "05/08/2025-06/06/2025", "06/07/2025-07/06/2025",
-        "07/07/2025-08/05/2025", "08/06/2025-09/04/2025", "09/05/2025-10/04/2025", "10/05/2025-11/03/2025",
-        "11/04/2025-12/03/2025", "12/04/2025-01/02/2026", "01/03/2026-02/01/2026", "02/02/2026-03/03/2026"
-    ]
-    
-    periods.extend(base_year_periods)
-    periods.extend(option_year_periods)
-    
-    return periods
+# Base Year periods (March 2024 - March 2025) followed by Option Year 1 periods (March 2025 - March 2026)
+_PERIODS: Tuple[str, ...] = (
+    "03/13/2024-04/11/2024", "04/12/2024-05/11/2024", "05/12/2024-06/10/2024", "06/11/2024-07/10/2024",
+    "07/11/2024-08/09/2024", "08/10/2024-09/08/2024", "09/09/2024-10/08/2024", "10/09/2024-11/07/2024",
+    "11/08/2024-12/07/2024", "12/08/2024-01/06/2025", "01/07/2025-02/05/2025", "02/06/2025-03/07/2025",
+    "03/08/2025-04/07/2025", "04/08/2025-05/07/2025", "05/08/2025-06/06/2025", "06/07/2025-07/06/2025",
+    "07/07/2025-08/05/2025", "08/06/2025-09/04/2025", "09/05/2025-10/04/2025", "10/05/2025-11/03/2025",
+    "11/04/2025-12/03/2025", "12/04/2025-01/02/2026", "01/03/2026-02/01/2026", "02/02/2026-03/03/2026",
+)
 
 
-def create_sample_employees() -> pd.DataFrame:
-    """Create sample employee data with all required fields"""
+def generate_time_periods() -> Tuple[str, ...]:
+    """Return monthly time periods for Base Year and Option Year 1"""
+    return _PERIODS
+
+
+def _build_sample_employees() -> pd.DataFrame:
+    """Build sample employee data with all required fields"""
     sample_data = [
         {"Name": "Shannon Gueringer", "LCAT": "PM", "Priced_Salary": 160000, "Current_Salary": 200000, 
          "Hours_Per_Month": 173, "Employee_Type": "Employee", "Company": "Skyward IT Solutions", "Status": "Active"},
@@ -73,8 +65,8 @@ def create_sample_employees() -> pd.DataFrame:
     return df
 
 
-def create_sample_subcontractors() -> pd.DataFrame:
-    """Create sample subcontractor data"""
+def _build_sample_subcontractors() -> pd.DataFrame:
+    """Build sample subcontractor data"""
     sample_data = [
         {"Name": "Adrien Adams", "Company": "BEELINE", "LCAT": "Data Systems SME", "Hourly_Rate": 250.0},
         {"Name": "Paulina Fisher", "Company": "FFtC", "LCAT": "HCD Researcher", "Hourly_Rate": 116.0},
@@ -92,6 +84,21 @@ def create_sample_subcontractors() -> pd.DataFrame:
     return df
 
 
+# Sample frames are built once at import; the create_* functions hand out copies
+_SAMPLE_EMPLOYEES = _build_sample_employees()
+_SAMPLE_SUBCONTRACTORS = _build_sample_subcontractors()
+
+
+def create_sample_employees() -> pd.DataFrame:
+    """Create sample employee data with all required fields"""
+    return _SAMPLE_EMPLOYEES.copy()
+
+
+def create_sample_subcontractors() -> pd.DataFrame:
+    """Create sample subcontractor data"""
+    return _SAMPLE_SUBCONTRACTORS.copy()
+
+
 def create_sample_odc() -> pd.DataFrame:
     """Create sample Other Direct Costs data"""
     # Generate time periods for ODC data
@@ -121,13 +128,11 @@ def create_sample_tasks() -> pd.DataFrame:
 
 def validate_employee_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     """Validate employee data for required fields and data types"""
-    errors = []
     required_fields = ['Name', 'LCAT', 'Current_Salary', 'Hours_Per_Month', 'Employee_Type', 'Company', 'Status']
     
-    # Check required fields
-    for field in required_fields:
-        if field not in df.columns:
-            errors.append(f"Missing required field: {field}")
+    # Check required fields first; a structurally invalid frame needs no row checks
+    columns = set(df.columns)
+    errors = [f"Missing required field: {field}" for field in required_fields if field not in columns]
     
     if errors:
         return False, errors
@@ -136,12 +141,14 @@ def validate_employee_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     if df['Name'].isna().any() or (df['Name'] == '').any():
         errors.append("Employee names cannot be empty")
     
-    # Check for valid salary values
-    if df['Current_Salary'].isna().any() or (df['Current_Salary'] < 0).any():
+    # Check for valid salary values (non-numeric entries coerce to NaN)
+    salaries = pd.to_numeric(df['Current_Salary'], errors='coerce')
+    if salaries.isna().any() or (salaries < 0).any():
         errors.append("Current salary must be non-negative numbers")
     
     # Check for valid hours
-    if df['Hours_Per_Month'].isna().any() or (df['Hours_Per_Month'] <= 0).any():
+    hours = pd.to_numeric(df['Hours_Per_Month'], errors='coerce')
+    if hours.isna().any() or (hours <= 0).any():
         errors.append("Hours per month must be positive numbers")
     
     return len(errors) == 0, errors
@@ -149,13 +156,11 @@ def validate_employee_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
 
 def validate_subcontractor_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     """Validate subcontractor data for required fields and data types"""
-    errors = []
     required_fields = ['Name', 'Company', 'LCAT', 'Hourly_Rate']
     
-    # Check required fields
-    for field in required_fields:
-        if field not in df.columns:
-            errors.append(f"Missing required field: {field}")
+    # Check required fields first; a structurally invalid frame needs no row checks
+    columns = set(df.columns)
+    errors = [f"Missing required field: {field}" for field in required_fields if field not in columns]
     
     if errors:
         return False, errors
@@ -164,8 +169,9 @@ def validate_subcontractor_data(df: pd.DataFrame) -> Tuple[bool, List[str]]:
     if df['Name'].isna().any() or (df['Name'] == '').any():
         errors.append("Subcontractor names cannot be empty")
     
-    # Check for valid hourly rates
-    if df['Hourly_Rate'].isna().any() or (df['Hourly_Rate'] <= 0).any():
+    # Check for valid hourly rates (non-numeric entries coerce to NaN)
+    rates = pd.to_numeric(df['Hourly_Rate'], errors='coerce')
+    if rates.isna().any() or (rates <= 0).any():
         errors.append("Hourly rate must be positive numbers")
     
     return len(errors) == 0, errors
@@ -183,10 +189,15 @@ def calculate_employee_metrics(employees_df: pd.DataFrame) -> Dict[str, Any]:
         }
     
     total_employees = len(employees_df)
-    total_salary = employees_df['Current_Salary'].sum()
-    average_salary = employees_df['Current_Salary'].mean()
-    active_employees = len(employees_df[employees_df['Status'] == 'Active'])
-    inactive_employees = len(employees_df[employees_df['Status'] == 'Inactive'])
+    
+    # Reduce on the raw NumPy buffer; NaN-aware to match pandas' skipna behavior
+    salaries = employees_df['Current_Salary'].to_numpy(dtype=np.float64, na_value=np.nan)
+    total_salary = np.nansum(salaries)
+    average_salary = np.nanmean(salaries)
+    
+    status = employees_df['Status']
+    active_employees = int((status == 'Active').sum())
+    inactive_employees = int((status == 'Inactive').sum())
     
     return {
         'total_employees': total_employees,
@@ -12,13 +12,13 @@ import base64
 
 # Import authentication and user management modules
 from auth import AuthManager, render_login_page, render_logout_button, require_auth, check_permission
-from user_management import UserManager, render_user_management_page, render_user_info_sidebar, render_data_access_notice
+from user_management import get_user_manager, render_user_management_page, render_user_info_sidebar, render_data_access_notice
 from theme_manager import ThemeManager, render_theme_toggle_sidebar
 from modern_ui import ModernUI
 from data_import_system import render_data_import_page
 
 # Import utility modules
-from utils.template_downloader import generate_employee_template, get_template_info
+from utils.template_downloader import generate_employee_template, get_template_info, warm_template_cache
 from styling import load_css, create_section, create_section_divider, create_section_grid, create_metric_card
 from data_utils import (
     generate_time_periods, create_sample_employees, create_sample_subcontractors,
@@ -177,7 +177,7 @@ class SEASFinancialTracker:
         
         if not employees_df.empty:
             # Filter sensitive data based on user permissions
-            user_manager = UserManager()
+            user_manager = get_user_manager()
             filtered_df = user_manager.filter_sensitive_data(employees_df, 'employees')
             # Use utility function to calculate metrics
             try:
@@ -250,12 +250,17 @@ class SEASFinancialTracker:
         """Create content for template download section"""
         st.markdown("Choose from our professionally designed templates to ensure consistent data entry and maintain all required fields.")
         
+        # Prepare both files ahead of the download buttons
+        warm_template_cache()
+        
         # Add template options using Streamlit
+        template_info = get_template_info()
         col1, col2 = st.columns(2)
         
         with col1:
+            basic_info = template_info["basic"]
             st.markdown("**Basic Template**")
-            st.markdown("5 required fields + monthly hours/revenue columns")
+            st.markdown(f"{basic_info['description']} ({basic_info['fields']} columns)")
             st.markdown("Perfect for quick employee data entry")
             
             if st.button("📥 Download Basic Template", key="download_basic"):
@@ -271,8 +276,9 @@ class SEASFinancialTracker:
                     st.error(f"Error generating template: {e}")
             
         with col2:
+            comprehensive_info = template_info["comprehensive"]
             st.markdown("**Comprehensive Template**")
-            st.markdown("10 fields + monthly hours/revenue + instructions")
+            st.markdown(f"{comprehensive_info['description']} ({comprehensive_info['fields']} columns)")
             st.markdown("Perfect for detailed employee management")
             
             if st.button("📥 Download Comprehensive Template", key="download_comprehensive"):
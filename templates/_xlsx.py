@@ -0,0 +1,37 @@
+"""
+Shared Excel writer for the template generation scripts
+"""
+
+import math
+
+import pandas as pd
+
+# Header cell style matching pandas' default to_excel header
+_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+
+def _cell_value(value):
+    """Map NaN to a blank cell and infinities to text, as to_excel does"""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return None
+        if math.isinf(value):
+            return 'inf' if value > 0 else '-inf'
+    return value
+
+
+def write_xlsx(excel_path, sheets):
+    """Write each sheet name -> DataFrame pair to one Excel workbook"""
+    header_format = None
+    with pd.ExcelWriter(excel_path) as writer:
+        for sheet_name, sheet_df in sheets.items():
+            if writer.engine == 'xlsxwriter':
+                # Small fixed tables: write rows directly, skipping pandas' per-cell formatting
+                if header_format is None:
+                    header_format = writer.book.add_format(_HEADER_FORMAT)
+                ws = writer.book.add_worksheet(sheet_name)
+                ws.write_row(0, 0, list(sheet_df.columns), header_format)
+                for i, row in enumerate(sheet_df.itertuples(index=False, name=None), start=1):
+                    ws.write_row(i, 0, [_cell_value(value) for value in row])
+            else:
+                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
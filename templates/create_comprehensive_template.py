@@ -7,6 +7,8 @@ Includes all fields for SEAS Financial Tracker
 import pandas as pd
 from pathlib import Path
 
+from _xlsx import write_xlsx
+
 def main():
     """Create comprehensive employee upload template"""
     
@@ -56,56 +58,56 @@ def main():
     for period in base_year_periods + option_year_periods:
         df[f'Revenue_{period}'] = 0.0
     
-    # Save as Excel with multiple sheets
-    excel_path = templates_dir / 'comprehensive_employee_template.xlsx'
+    # Instructions sheet
+    instructions = {
+        'Field': ['Name', 'LCAT', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Department', 'Start_Date', 'Location', 'Manager', 'Skills'],
+        'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No'],
+        'Description': [
+            'Full name of the employee',
+            'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
+            'Original budgeted salary for the project',
+            'Current actual salary being paid',
+            'Standard hours worked per month (typically 173)',
+            'Department or team assignment',
+            'Employee start date (YYYY-MM-DD format)',
+            'Work location (Remote, On-site, Hybrid)',
+            'Direct manager or supervisor',
+            'Key skills and competencies (comma-separated)'
+        ]
+    }
+    
+    instructions_df = pd.DataFrame(instructions)
     
-    with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
-        # Main data sheet
-        df.to_excel(writer, sheet_name='Employee_Data', index=False)
-        
-        # Instructions sheet
-        instructions = {
-            'Field': ['Name', 'LCAT', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Department', 'Start_Date', 'Location', 'Manager', 'Skills'],
-            'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No'],
-            'Description': [
-                'Full name of the employee',
-                'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
-                'Original budgeted salary for the project',
-                'Current actual salary being paid',
-                'Standard hours worked per month (typically 173)',
-                'Department or team assignment',
-                'Employee start date (YYYY-MM-DD format)',
-                'Work location (Remote, On-site, Hybrid)',
-                'Direct manager or supervisor',
-                'Key skills and competencies (comma-separated)'
-            ]
-        }
-        
-        instructions_df = pd.DataFrame(instructions)
-        instructions_df.to_excel(writer, sheet_name='Instructions', index=False)
-        
-        # Validation options - pad arrays to same length
-        max_length = max(
-            len(['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev']),
-            len(['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business']),
-            len(['Remote', 'On-site', 'Hybrid', 'Travel'])
-        )
-        
-        lcat_options = ['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'] + [''] * (max_length - 8)
-        dept_options = ['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'] + [''] * (max_length - 8)
-        loc_options = ['Remote', 'On-site', 'Hybrid', 'Travel'] + [''] * (max_length - 4)
-        
-        validation = {
-            'LCAT_Options': lcat_options,
-            'Department_Options': dept_options,
-            'Location_Options': loc_options
-        }
-        
-        validation_df = pd.DataFrame(validation)
-        validation_df.to_excel(writer, sheet_name='Validation_Options', index=False)
-    
-    # Save as CSV
+    # Validation options - pad arrays to same length
+    max_length = max(
+        len(['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev']),
+        len(['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business']),
+        len(['Remote', 'On-site', 'Hybrid', 'Travel'])
+    )
+    
+    lcat_options = ['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'] + [''] * (max_length - 8)
+    dept_options = ['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'] + [''] * (max_length - 8)
+    loc_options = ['Remote', 'On-site', 'Hybrid', 'Travel'] + [''] * (max_length - 4)
+    
+    validation = {
+        'LCAT_Options': lcat_options,
+        'Department_Options': dept_options,
+        'Location_Options': loc_options
+    }
+    
+    validation_df = pd.DataFrame(validation)
+    
+    sheets = {
+        'Employee_Data': df,
+        'Instructions': instructions_df,
+        'Validation_Options': validation_df
+    }
+    
+    # Save as Excel with multiple sheets, then as CSV
+    excel_path = templates_dir / 'comprehensive_employee_template.xlsx'
     csv_path = templates_dir / 'comprehensive_employee_template.csv'
+    
+    write_xlsx(excel_path, sheets)
     df.to_csv(csv_path, index=False)
     
     print(f"✅ Comprehensive Excel template: {excel_path}")
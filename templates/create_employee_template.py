@@ -7,6 +7,8 @@ Simple and reliable template generator
 import pandas as pd
 from pathlib import Path
 
+from _xlsx import write_xlsx
+
 def main():
     """Create employee upload template"""
     
@@ -51,12 +53,11 @@ def main():
     for period in base_year_periods + option_year_periods:
         df[f'Revenue_{period}'] = 0.0
     
-    # Save as Excel
+    # Save as Excel, then as CSV
     excel_path = templates_dir / 'employee_template.xlsx'
-    df.to_excel(excel_path, index=False, sheet_name='Employee_Data')
-    
-    # Save as CSV
     csv_path = templates_dir / 'employee_template.csv'
+    
+    write_xlsx(excel_path, {'Employee_Data': df})
     df.to_csv(csv_path, index=False)
     
     print(f"✅ Excel template: {excel_path}")
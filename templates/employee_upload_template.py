@@ -9,6 +9,11 @@ import os
 from pathlib import Path
 from datetime import datetime
 
+from _xlsx import write_xlsx
+
+# Number of sample employees in the Excel template; every column list must match
+N_EMPLOYEES = 10
+
 def create_employee_template():
     """Create Excel template for employee data uploads"""
     
@@ -66,18 +71,7 @@ def create_employee_template():
             140000,
             90000
         ],
-        'Hours_Per_Month': [
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173,
-            173
-        ],
+        'Hours_Per_Month': [173] * N_EMPLOYEES,
         'Department': [
             'Management',
             'Management',
@@ -102,18 +96,7 @@ def create_employee_template():
             '2024-02-10',
             '2024-01-12'
         ],
-        'Location': [
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote',
-            'Remote'
-        ],
+        'Location': ['Remote'] * N_EMPLOYEES,
         'Manager': [
             'Program Director',
             'Program Director',
@@ -163,111 +146,111 @@ def create_employee_template():
     # Create Excel file with multiple sheets
     template_path = templates_dir / 'employee_upload_template.xlsx'
     
-    with pd.ExcelWriter(template_path, engine='openpyxl') as writer:
-        # Main data sheet
-        df.to_excel(writer, sheet_name='Employee_Data', index=False)
-        
-        # Instructions sheet
-        instructions_data = {
-            'Field': [
-                'Name',
-                'LCAT',
-                'Priced_Salary',
-                'Current_Salary', 
-                'Hours_Per_Month',
-                'Department',
-                'Start_Date',
-                'Location',
-                'Manager',
-                'Skills',
-                'Hours_[Period]',
-                'Revenue_[Period]'
-            ],
-            'Description': [
-                'Full name of the employee',
-                'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
-                'Original budgeted salary for the project',
-                'Current actual salary being paid',
-                'Standard hours worked per month (typically 173)',
-                'Department or team assignment',
-                'Employee start date (YYYY-MM-DD format)',
-                'Work location (Remote, On-site, Hybrid)',
-                'Direct manager or supervisor',
-                'Key skills and competencies (comma-separated)',
-                'Hours worked in specific time period (populated by app)',
-                'Revenue generated in specific time period (populated by app)'
-            ],
-            'Required': [
-                'Yes',
-                'Yes',
-                'Yes',
-                'Yes',
-                'Yes',
-                'No',
-                'No',
-                'No',
-                'No',
-                'No',
-                'No (Auto-calculated)',
-                'No (Auto-calculated)'
-            ],
-            'Example': [
-                'John Smith',
-                'PM',
-                '150000',
-                '160000',
-                '173',
-                'Management',
-                '2024-01-15',
-                'Remote',
-                'Program Director',
-                'Leadership, Project Management',
-                '0.0',
-                '0.0'
-            ]
-        }
-        
-        instructions_df = pd.DataFrame(instructions_data)
-        instructions_df.to_excel(writer, sheet_name='Field_Instructions', index=False)
-        
-        # Validation sheet
-        validation_data = {
-            'LCAT_Options': [
-                'PM',
-                'SA/Eng Lead',
-                'AI Lead',
-                'HCD Lead',
-                'Scrum Master',
-                'Cloud Data Engineer',
-                'SRE',
-                'Full Stack Dev',
-                'Data Scientist',
-                'UX Designer',
-                'DevOps Engineer',
-                'Business Analyst'
-            ],
-            'Department_Options': [
-                'Management',
-                'Engineering',
-                'AI/ML',
-                'Design',
-                'Agile',
-                'Data Engineering',
-                'DevOps',
-                'Business',
-                'Operations',
-                'Quality Assurance'
-            ],
-            'Location_Options': [
-                'Remote',
-                'On-site',
-                'Hybrid',
-                'Travel'
-            ]
-        }
-        
-        validation_df = pd.DataFrame(validation_data)
-        validation_df.to_excel(writer, sheet_name='Validation_Options', index=False)
+    # Instructions sheet
+    instructions_data = {
+        'Field': [
+            'Name',
+            'LCAT',
+            'Priced_Salary',
+            'Current_Salary', 
+            'Hours_Per_Month',
+            'Department',
+            'Start_Date',
+            'Location',
+            'Manager',
+            'Skills',
+            'Hours_[Period]',
+            'Revenue_[Period]'
+        ],
+        'Description': [
+            'Full name of the employee',
+            'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
+            'Original budgeted salary for the project',
+            'Current actual salary being paid',
+            'Standard hours worked per month (typically 173)',
+            'Department or team assignment',
+            'Employee start date (YYYY-MM-DD format)',
+            'Work location (Remote, On-site, Hybrid)',
+            'Direct manager or supervisor',
+            'Key skills and competencies (comma-separated)',
+            'Hours worked in specific time period (populated by app)',
+            'Revenue generated in specific time period (populated by app)'
+        ],
+        'Required': [
+            'Yes',
+            'Yes',
+            'Yes',
+            'Yes',
+            'Yes',
+            'No',
+            'No',
+            'No',
+            'No',
+            'No',
+            'No (Auto-calculated)',
+            'No (Auto-calculated)'
+        ],
+        'Example': [
+            'John Smith',
+            'PM',
+            '150000',
+            '160000',
+            '173',
+            'Management',
+            '2024-01-15',
+            'Remote',
+            'Program Director',
+            'Leadership, Project Management',
+            '0.0',
+            '0.0'
+        ]
+    }
+    
+    instructions_df = pd.DataFrame(instructions_data)
+    
+    # Validation sheet
+    validation_data = {
+        'LCAT_Options': [
+            'PM',
+            'SA/Eng Lead',
+            'AI Lead',
+            'HCD Lead',
+            'Scrum Master',
+            'Cloud Data Engineer',
+            'SRE',
+            'Full Stack Dev',
+            'Data Scientist',
+            'UX Designer',
+            'DevOps Engineer',
+            'Business Analyst'
+        ],
+        'Department_Options': [
+            'Management',
+            'Engineering',
+            'AI/ML',
+            'Design',
+            'Agile',
+            'Data Engineering',
+            'DevOps',
+            'Business',
+            'Operations',
+            'Quality Assurance'
+        ],
+        'Location_Options': [
+            'Remote',
+            'On-site',
+            'Hybrid',
+            'Travel'
+        ]
+    }
+    
+    validation_df = pd.DataFrame(validation_data)
+    
+    write_xlsx(template_path, {
+        'Employee_Data': df,
+        'Field_Instructions': instructions_df,
+        'Validation_Options': validation_df
+    })
     
     print(f"✅ Employee template created: {template_path}")
     print(f"📊 Template includes {len(df)} sample employees")
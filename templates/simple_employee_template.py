@@ -7,6 +7,8 @@ Creates Excel template with all required fields for SEAS Financial Tracker
 import pandas as pd
 from pathlib import Path
 
+from _xlsx import write_xlsx
+
 def create_employee_template():
     """Create Excel template for employee data uploads"""
     
@@ -34,41 +36,41 @@ def create_employee_template():
     # Create Excel file
     template_path = templates_dir / 'employee_upload_template.xlsx'
     
-    with pd.ExcelWriter(template_path, engine='openpyxl') as writer:
-        # Main data sheet
-        df.to_excel(writer, sheet_name='Employee_Data', index=False)
-        
-        # Instructions sheet
-        instructions_data = {
-            'Field': ['Name', 'LCAT', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Department', 'Start_Date', 'Location', 'Manager', 'Skills'],
-            'Description': [
-                'Full name of the employee',
-                'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
-                'Original budgeted salary for the project',
-                'Current actual salary being paid',
-                'Standard hours worked per month (typically 173)',
-                'Department or team assignment',
-                'Employee start date (YYYY-MM-DD format)',
-                'Work location (Remote, On-site, Hybrid)',
-                'Direct manager or supervisor',
-                'Key skills and competencies (comma-separated)'
-            ],
-            'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No'],
-            'Example': ['John Smith', 'PM', '150000', '160000', '173', 'Management', '2024-01-15', 'Remote', 'Program Director', 'Leadership, Project Management']
-        }
-        
-        instructions_df = pd.DataFrame(instructions_data)
-        instructions_df.to_excel(writer, sheet_name='Field_Instructions', index=False)
-        
-        # Validation sheet
-        validation_data = {
-            'LCAT_Options': ['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'],
-            'Department_Options': ['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'],
-            'Location_Options': ['Remote', 'On-site', 'Hybrid', 'Travel']
-        }
-        
-        validation_df = pd.DataFrame(validation_data)
-        validation_df.to_excel(writer, sheet_name='Validation_Options', index=False)
+    # Instructions sheet
+    instructions_data = {
+        'Field': ['Name', 'LCAT', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Department', 'Start_Date', 'Location', 'Manager', 'Skills'],
+        'Description': [
+            'Full name of the employee',
+            'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
+            'Original budgeted salary for the project',
+            'Current actual salary being paid',
+            'Standard hours worked per month (typically 173)',
+            'Department or team assignment',
+            'Employee start date (YYYY-MM-DD format)',
+            'Work location (Remote, On-site, Hybrid)',
+            'Direct manager or supervisor',
+            'Key skills and competencies (comma-separated)'
+        ],
+        'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No'],
+        'Example': ['John Smith', 'PM', '150000', '160000', '173', 'Management', '2024-01-15', 'Remote', 'Program Director', 'Leadership, Project Management']
+    }
+    
+    instructions_df = pd.DataFrame(instructions_data)
+    
+    # Validation sheet
+    validation_data = {
+        'LCAT_Options': ['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'],
+        'Department_Options': ['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'],
+        'Location_Options': ['Remote', 'On-site', 'Hybrid', 'Travel']
+    }
+    
+    validation_df = pd.DataFrame(validation_data)
+    
+    write_xlsx(template_path, {
+        'Employee_Data': df,
+        'Field_Instructions': instructions_df,
+        'Validation_Options': validation_df
+    })
     
     print(f"✅ Employee template created: {template_path}")
     print(f"📊 Template includes {len(df)} sample employees")
@@ -6,45 +6,106 @@ import pytest
 import pandas as pd
 import streamlit as st
 from unittest.mock import Mock, patch
-import sys
 import os
+import hashlib
+
+# Source data for the sample DataFrame fixtures, keyed by fixture name below
+_SAMPLE_EMPLOYEES = {
+    'Name': ['John Doe', 'Jane Smith', 'Bob Johnson'],
+    'LCAT': ['Senior Engineer', 'Project Manager', 'Analyst'],
+    'Current_Salary': [85000, 95000, 65000],
+    'Priced_Salary': [100000, 110000, 75000],
+    'Status': ['Active', 'Active', 'Active'],
+    'Hours_Jan': [160, 160, 160],
+    'Hours_Feb': [160, 160, 160],
+    'Revenue_Jan': [10000, 11000, 7500],
+    'Revenue_Feb': [10000, 11000, 7500]
+}
+
+
+_SAMPLE_SUBCONTRACTORS = {
+    'Name': ['ABC Corp', 'XYZ Ltd', 'DEF Inc'],
+    'LCAT': ['Consultant', 'Specialist', 'Advisor'],
+    'Hourly_Rate': [150, 200, 125],
+    'Status': ['Active', 'Active', 'Active'],
+    'Hours_Jan': [80, 60, 100],
+    'Hours_Feb': [80, 60, 100],
+    'Revenue_Jan': [12000, 12000, 12500],
+    'Revenue_Feb': [12000, 12000, 12500]
+}
+
+
+_SAMPLE_TASKS = {
+    'Task_ID': ['T001', 'T002', 'T003'],
+    'Task_Name': ['Design', 'Development', 'Testing'],
+    'Assigned_To': ['John Doe', 'Jane Smith', 'Bob Johnson'],
+    'Status': ['In Progress', 'Completed', 'Pending'],
+    'Hours_Estimated': [40, 80, 20],
+    'Hours_Actual': [35, 85, 0],
+    'Cost_Estimated': [4000, 8000, 2000],
+    'Cost_Actual': [3500, 8500, 0]
+}
+
+
+_SAMPLE_ODC = {
+    'Category': ['Travel', 'Equipment', 'Software'],
+    'Description': ['Business travel', 'Hardware purchase', 'License fees'],
+    'Amount': [5000, 10000, 3000],
+    'Period': ['Jan', 'Jan', 'Feb'],
+    'Status': ['Approved', 'Approved', 'Pending']
+}
+
+
+_SAMPLE_FRAMES = {
+    'sample_employees_data': _SAMPLE_EMPLOYEES,
+    'sample_subcontractors_data': _SAMPLE_SUBCONTRACTORS,
+    'sample_tasks_data': _SAMPLE_TASKS,
+    'sample_odc_data': _SAMPLE_ODC
+}
+
+
+def _load_parquet_frame(cache_dir, name, data):
+    """Read a sample DataFrame from the parquet cache, writing it on first use"""
+    fingerprint = hashlib.sha1(repr(sorted(data.items())).encode()).hexdigest()[:12]
+    path = cache_dir / f'{name}_{fingerprint}.parquet'
+    
+    if not path.exists():
+        # Write to a private temp file first so concurrent workers never read a partial file
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        pd.DataFrame(data).to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    
+    return pd.read_parquet(path, memory_map=True)
+
 
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+@pytest.fixture(scope="session")
+def parquet_frames(request):
+    """Sample DataFrames shared through parquet files in the pytest cache"""
+    cache = getattr(request.config, 'cache', None)
+    if cache is None:
+        return {name: pd.DataFrame(data) for name, data in _SAMPLE_FRAMES.items()}
+    
+    cache_dir = cache.mkdir('fixtures')
+    try:
+        return {name: _load_parquet_frame(cache_dir, name, data) for name, data in _SAMPLE_FRAMES.items()}
+    except ImportError:
+        # No parquet engine installed - build the frames in memory
+        return {name: pd.DataFrame(data) for name, data in _SAMPLE_FRAMES.items()}
 
 
-@pytest.fixture
-def sample_employees_data():
+@pytest.fixture(scope="session")
+def sample_employees_data(parquet_frames):
     """Sample employee data for testing"""
-    return pd.DataFrame({
-        'Name': ['John Doe', 'Jane Smith', 'Bob Johnson'],
-        'LCAT': ['Senior Engineer', 'Project Manager', 'Analyst'],
-        'Current_Salary': [85000, 95000, 65000],
-        'Priced_Salary': [100000, 110000, 75000],
-        'Status': ['Active', 'Active', 'Active'],
-        'Hours_Jan': [160, 160, 160],
-        'Hours_Feb': [160, 160, 160],
-        'Revenue_Jan': [10000, 11000, 7500],
-        'Revenue_Feb': [10000, 11000, 7500]
-    })
+    return parquet_frames['sample_employees_data']
 
 
-@pytest.fixture
-def sample_subcontractors_data():
+@pytest.fixture(scope="session")
+def sample_subcontractors_data(parquet_frames):
     """Sample subcontractor data for testing"""
-    return pd.DataFrame({
-        'Name': ['ABC Corp', 'XYZ Ltd', 'DEF Inc'],
-        'LCAT': ['Consultant', 'Specialist', 'Advisor'],
-        'Hourly_Rate': [150, 200, 125],
-        'Status': ['Active', 'Active', 'Active'],
-        'Hours_Jan': [80, 60, 100],
-        'Hours_Feb': [80, 60, 100],
-        'Revenue_Jan': [12000, 12000, 12500],
-        'Revenue_Feb': [12000, 12000, 12500]
-    })
+    return parquet_frames['sample_subcontractors_data']
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_project_params():
     """Sample project parameters for testing"""
     return {
@@ -118,27 +179,12 @@ def sample_time_periods():
 
 
 @pytest.fixture
-def sample_tasks_data():
+def sample_tasks_data(parquet_frames):
     """Sample tasks data for testing"""
-    return pd.DataFrame({
-        'Task_ID': ['T001', 'T002', 'T003'],
-        'Task_Name': ['Design', 'Development', 'Testing'],
-        'Assigned_To': ['John Doe', 'Jane Smith', 'Bob Johnson'],
-        'Status': ['In Progress', 'Completed', 'Pending'],
-        'Hours_Estimated': [40, 80, 20],
-        'Hours_Actual': [35, 85, 0],
-        'Cost_Estimated': [4000, 8000, 2000],
-        'Cost_Actual': [3500, 8500, 0]
-    })
+    return parquet_frames['sample_tasks_data'].copy()
 
 
 @pytest.fixture
-def sample_odc_data():
+def sample_odc_data(parquet_frames):
     """Sample ODC (Other Direct Costs) data for testing"""
-    return pd.DataFrame({
-        'Category': ['Travel', 'Equipment', 'Software'],
-        'Description': ['Business travel', 'Hardware purchase', 'License fees'],
-        'Amount': [5000, 10000, 3000],
-        'Period': ['Jan', 'Jan', 'Feb'],
-        'Status': ['Approved', 'Approved', 'Pending']
-    })
+    return parquet_frames['sample_odc_data'].copy()
@@ -0,0 +1,21 @@
+"""
+Pytest fixtures shared by the SEAS Financial Tracker unit tests
+"""
+
+import functools
+
+import pytest
+
+from auth import AuthManager
+
+
+@pytest.fixture(scope="session")
+def auth_manager():
+    """AuthManager built once and shared across the unit tests"""
+    return AuthManager()
+
+
+@pytest.fixture(scope="session")
+def hash_password(auth_manager):
+    """AuthManager.hash_password memoized for the test session"""
+    return functools.lru_cache(maxsize=64)(auth_manager.hash_password)
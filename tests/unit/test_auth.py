@@ -4,148 +4,147 @@ Unit tests for authentication module
 
 import pytest
 import hashlib
-from unittest.mock import Mock, patch
-import sys
 import os
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from types import SimpleNamespace
 
 from auth import AuthManager
 
 
+class _SessionState(SimpleNamespace):
+    """Attribute-based session state with the mapping calls auth.py relies on"""
+    
+    def __contains__(self, key):
+        return key in self.__dict__
+    
+    def get(self, key, default=None):
+        return self.__dict__.get(key, default)
+    
+    def update(self, **values):
+        self.__dict__.update(values)
+
+
+@pytest.fixture(autouse=True)
+def session_state(monkeypatch):
+    """Swap streamlit.session_state for a fresh namespace for each test"""
+    state = _SessionState()
+    monkeypatch.setattr('streamlit.session_state', state, raising=False)
+    return state
+
+
+@pytest.mark.xdist_group("auth")
 class TestAuthManager:
     """Test cases for AuthManager class"""
     
-    def test_init(self):
+    def test_init(self, auth_manager):
         """Test AuthManager initialization"""
-        auth_manager = AuthManager()
         assert auth_manager is not None
-        assert hasattr(auth_manager, 'salt')
-        assert hasattr(auth_manager, 'users')
+        assert auth_manager.session_timeout == 3600
+        assert auth_manager.max_login_attempts == 3
+        assert auth_manager.lockout_duration == 300
+    
+    def test_auth_manager_has_slots(self):
+        """Test AuthManager stores its settings in slots rather than a __dict__"""
+        assert AuthManager.__slots__ == ('session_timeout', 'max_login_attempts', 'lockout_duration')
+        assert not hasattr(AuthManager(), '__dict__')
     
-    def test_hash_password(self):
+    def test_hash_password(self, auth_manager, hash_password):
         """Test password hashing"""
-        auth_manager = AuthManager()
         password = "test_password"
-        hashed = auth_manager._hash_password(password)
+        hashed = hash_password(password)
         
         # Should return a string
         assert isinstance(hashed, str)
         # Should be different from original password
         assert hashed != password
-        # Should be consistent
-        assert hashed == auth_manager._hash_password(password)
+        # Should be consistent (compare against an uncached call)
+        assert hashed == auth_manager.hash_password(password)
     
-    def test_verify_password(self):
+    def test_hash_password_uses_blake2b(self, hash_password):
+        """Test password hashing produces a 32-byte BLAKE2b hex digest"""
+        hashed = hash_password("test_password")
+        
+        # Should be 64 hex characters
+        assert len(hashed) == 64
+        # Should match a BLAKE2b digest keyed with the salt
+        salt = os.getenv('AUTH_SALT', 'seas_financial_tracker_2024')
+        assert hashed == hashlib.blake2b(b"test_password", key=salt.encode()[:64], digest_size=32).hexdigest()
+    
+    def test_verify_password(self, auth_manager, hash_password):
         """Test password verification"""
-        auth_manager = AuthManager()
         password = "test_password"
-        hashed = auth_manager._hash_password(password)
+        hashed = hash_password(password)
         
         # Should verify correct password
-        assert auth_manager._verify_password(password, hashed) is True
+        assert auth_manager.hash_password(password) == hashed
         # Should reject incorrect password
-        assert auth_manager._verify_password("wrong_password", hashed) is False
+        assert auth_manager.hash_password("wrong_password") != hashed
     
-    def test_authenticate_valid_credentials(self):
+    def test_authenticate_valid_credentials(self, auth_manager):
         """Test authentication with valid credentials"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {}):
-            result = auth_manager.authenticate("admin", "admin123")
-            assert result is True
-            assert auth_manager.is_authenticated() is True
+        password = auth_manager.get_credentials()['admin']
+        result = auth_manager.login("admin", password)
+        assert result is True
+        assert auth_manager.is_authenticated() is True
     
-    def test_authenticate_invalid_credentials(self):
+    def test_authenticate_invalid_credentials(self, auth_manager):
         """Test authentication with invalid credentials"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {}):
-            result = auth_manager.authenticate("admin", "wrong_password")
-            assert result is False
-            assert auth_manager.is_authenticated() is False
+        result = auth_manager.login("admin", "wrong_password")
+        assert result is False
+        assert auth_manager.is_authenticated() is False
     
-    def test_authenticate_nonexistent_user(self):
+    def test_authenticate_nonexistent_user(self, auth_manager):
         """Test authentication with nonexistent user"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {}):
-            result = auth_manager.authenticate("nonexistent", "password")
-            assert result is False
-            assert auth_manager.is_authenticated() is False
+        result = auth_manager.login("nonexistent", "password")
+        assert result is False
+        assert auth_manager.is_authenticated() is False
     
-    def test_logout(self):
+    def test_logout(self, auth_manager, session_state):
         """Test logout functionality"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': True, 'username': 'admin'}):
-            auth_manager.logout()
-            assert auth_manager.is_authenticated() is False
+        session_state.update(authenticated=True, username='admin')
+        auth_manager.logout()
+        assert auth_manager.is_authenticated() is False
     
-    def test_get_user_role(self):
+    def test_get_user_role(self, auth_manager, session_state):
         """Test getting user role"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': True, 'username': 'admin'}):
-            role = auth_manager.get_user_role()
-            assert role == 'admin'
+        session_state.update(authenticated=True, username='admin')
+        role = auth_manager.get_user_role()
+        assert role == 'admin'
     
-    def test_get_user_role_unauthenticated(self):
+    def test_get_user_role_unauthenticated(self, auth_manager, session_state):
         """Test getting user role when not authenticated"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': False}):
-            role = auth_manager.get_user_role()
-            assert role is None
+        session_state.update(authenticated=False)
+        role = auth_manager.get_user_role()
+        assert role == 'guest'
     
-    def test_check_permission_admin(self):
+    def test_check_permission_admin(self, auth_manager, session_state):
         """Test permission checking for admin user"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': True, 'username': 'admin'}):
-            # Admin should have all permissions
-            assert auth_manager.check_permission('manage_users') is True
-            assert auth_manager.check_permission('view') is True
-            assert auth_manager.check_permission('edit') is True
-            assert auth_manager.check_permission('delete') is True
-    
-    def test_check_permission_manager(self):
+        session_state.update(authenticated=True, username='admin')
+        # Admin should have all permissions
+        assert auth_manager.has_permission('manage_users') is True
+        assert auth_manager.has_permission('view') is True
+        assert auth_manager.has_permission('edit') is True
+        assert auth_manager.has_permission('delete') is True
+    
+    def test_check_permission_manager(self, auth_manager, session_state):
         """Test permission checking for manager user"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': True, 'username': 'manager'}):
-            # Manager should have limited permissions
-            assert auth_manager.check_permission('view') is True
-            assert auth_manager.check_permission('edit') is True
-            assert auth_manager.check_permission('manage_users') is False
-    
-    def test_check_permission_viewer(self):
+        session_state.update(authenticated=True, username='manager')
+        # Manager should have limited permissions
+        assert auth_manager.has_permission('view') is True
+        assert auth_manager.has_permission('edit') is True
+        assert auth_manager.has_permission('manage_users') is False
+    
+    def test_check_permission_viewer(self, auth_manager, session_state):
         """Test permission checking for viewer user"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': True, 'username': 'viewer'}):
-            # Viewer should have read-only permissions
-            assert auth_manager.check_permission('view') is True
-            assert auth_manager.check_permission('edit') is False
-            assert auth_manager.check_permission('manage_users') is False
-    
-    def test_check_permission_unauthenticated(self):
+        session_state.update(authenticated=True, username='viewer')
+        # Viewer should have read-only permissions
+        assert auth_manager.has_permission('view') is True
+        assert auth_manager.has_permission('edit') is False
+        assert auth_manager.has_permission('manage_users') is False
+    
+    def test_check_permission_unauthenticated(self, auth_manager, session_state):
         """Test permission checking when not authenticated"""
-        auth_manager = AuthManager()
-        
-        # Mock session state
-        with patch('streamlit.session_state', {'authenticated': False}):
-            # Unauthenticated users should have no permissions
-            assert auth_manager.check_permission('view') is False
-            assert auth_manager.check_permission('edit') is False
-            assert auth_manager.check_permission('manage_users') is False
+        session_state.update(authenticated=False)
+        # Unauthenticated users should have no permissions
+        assert auth_manager.has_permission('view') is False
+        assert auth_manager.has_permission('edit') is False
+        assert auth_manager.has_permission('manage_users') is False
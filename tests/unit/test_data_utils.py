@@ -3,13 +3,11 @@ Unit tests for data utilities module
 """
 
 import pytest
+import time
+import numpy as np
 import pandas as pd
-import sys
-import os
-
-# Add the project root to the Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import data_utils
 from data_utils import (
     generate_time_periods,
     create_sample_employees,
@@ -21,6 +19,7 @@ from data_utils import (
 )
 
 
+@pytest.mark.xdist_group("data")
 class TestDataUtils:
     """Test cases for data utility functions"""
     
@@ -28,16 +27,15 @@ class TestDataUtils:
         """Test time period generation"""
         periods = generate_time_periods()
         
-        # Should return a list
-        assert isinstance(periods, list)
+        # Should return the precomputed module-level tuple
+        assert periods is data_utils._PERIODS
+        assert isinstance(periods, tuple)
         # Should have 24 periods (2 years)
         assert len(periods) == 24
-        # Should start with Jan
-        assert periods[0] == 'Jan'
-        # Should have standard month names
-        expected_months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                          'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-        assert periods[:12] == expected_months
+        # Should start with the first Base Year period
+        assert periods[0] == "03/13/2024-04/11/2024"
+        # Should end with the last Option Year 1 period
+        assert periods[-1] == "02/02/2026-03/03/2026"
     
     def test_create_sample_employees(self):
         """Test sample employee data creation"""
@@ -52,6 +50,18 @@ class TestDataUtils:
         for col in required_columns:
             assert col in employees_df.columns
     
+    def test_create_sample_employees_is_cached(self):
+        """Test sample employee data comes from the frame built at import"""
+        first = create_sample_employees()
+        second = create_sample_employees()
+        
+        # Should match the prebuilt frame
+        pd.testing.assert_frame_equal(first, data_utils._SAMPLE_EMPLOYEES)
+        # Should hand out independent copies so callers can edit them
+        first.loc[0, 'Current_Salary'] = -1
+        assert second.loc[0, 'Current_Salary'] != -1
+        pd.testing.assert_frame_equal(create_sample_employees(), data_utils._SAMPLE_EMPLOYEES)
+    
     def test_create_sample_subcontractors(self):
         """Test sample subcontractor data creation"""
         subcontractors_df = create_sample_subcontractors()
@@ -65,6 +75,18 @@ class TestDataUtils:
         for col in required_columns:
             assert col in subcontractors_df.columns
     
+    def test_create_sample_subcontractors_is_cached(self):
+        """Test sample subcontractor data comes from the frame built at import"""
+        first = create_sample_subcontractors()
+        second = create_sample_subcontractors()
+        
+        # Should match the prebuilt frame
+        pd.testing.assert_frame_equal(first, data_utils._SAMPLE_SUBCONTRACTORS)
+        # Should hand out independent copies so callers can edit them
+        first.loc[0, 'Hourly_Rate'] = -1
+        assert second.loc[0, 'Hourly_Rate'] != -1
+        pd.testing.assert_frame_equal(create_sample_subcontractors(), data_utils._SAMPLE_SUBCONTRACTORS)
+    
     def test_calculate_employee_metrics(self, sample_employees_data):
         """Test employee metrics calculation"""
         metrics = calculate_employee_metrics(sample_employees_data)
@@ -82,6 +104,27 @@ class TestDataUtils:
         assert metrics['total_salary'] == 245000  # 85000 + 95000 + 65000
         assert metrics['average_salary'] == 81666.67  # 245000 / 3
     
+    @pytest.mark.parametrize("n", [1_000_000])
+    def test_calculate_employee_metrics_scales(self, n):
+        """Test employee metrics stay fast on large frames"""
+        df = pd.DataFrame({
+            'Current_Salary': np.random.default_rng(0).integers(50_000, 150_000, n),
+            'Status': ['Active'] * n
+        })
+        
+        # Best of several runs so a busy xdist worker does not fail the test
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            metrics = calculate_employee_metrics(df)
+            timings.append(time.perf_counter() - start)
+        
+        # Should match the pandas reduction
+        assert metrics['total_salary'] == df['Current_Salary'].sum()
+        assert metrics['active_employees'] == n
+        # Should run at NumPy speed
+        assert min(timings) < 0.15
+    
     def test_calculate_subcontractor_metrics(self, sample_subcontractors_data):
         """Test subcontractor metrics calculation"""
         metrics = calculate_subcontractor_metrics(sample_subcontractors_data)
@@ -121,6 +164,30 @@ class TestDataUtils:
         # Should have errors
         assert len(errors) > 0
     
+    def test_validate_employee_data_missing_columns_short_circuits(self):
+        """Test employee data validation returns early for missing columns"""
+        n = 1_000_000
+        names = np.full(n, 'John Doe', dtype=object)
+        names[-1] = ''  # Would be reported if the row checks ran
+        invalid_df = pd.DataFrame({
+            'Name': names,
+            'LCAT': np.full(n, 'Engineer', dtype=object),
+            'Status': np.full(n, 'Active', dtype=object)
+            # Missing Current_Salary and other required columns
+        })
+        
+        is_valid, errors = validate_employee_data(invalid_df)
+        
+        # Should be invalid
+        assert is_valid is False
+        # Should report only the missing columns, without touching the rows
+        assert errors == [
+            "Missing required field: Current_Salary",
+            "Missing required field: Hours_Per_Month",
+            "Missing required field: Employee_Type",
+            "Missing required field: Company"
+        ]
+    
     def test_validate_employee_data_invalid_salary(self):
         """Test employee data validation with invalid salary"""
         invalid_df = pd.DataFrame({
@@ -137,6 +204,50 @@ class TestDataUtils:
         # Should have errors
         assert len(errors) > 0
     
+    def test_validate_employee_data_scales(self):
+        """Test employee data validation stays fast on large frames"""
+        n = 500_000
+        df = pd.DataFrame({
+            'Name': ['John Doe'] * n,
+            'LCAT': ['Engineer'] * n,
+            'Current_Salary': [85000] * (n - 1) + [-1],
+            'Hours_Per_Month': [173] * n,
+            'Employee_Type': ['Employee'] * n,
+            'Company': ['Skyward IT Solutions'] * n,
+            'Status': ['Active'] * n
+        })
+        
+        # Best of several runs so a busy xdist worker does not fail the test
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            is_valid, errors = validate_employee_data(df)
+            timings.append(time.perf_counter() - start)
+        
+        # Should catch the single negative salary
+        assert is_valid is False
+        assert errors == ["Current salary must be non-negative numbers"]
+        # Should run as vectorized column checks
+        assert min(timings) < 0.1
+    
+    def test_validate_employee_data_non_numeric_salary(self):
+        """Test employee data validation rejects salaries that are not numbers"""
+        df = pd.DataFrame({
+            'Name': ['John Doe', 'Jane Smith'],
+            'LCAT': ['Engineer', 'Manager'],
+            'Current_Salary': [85000, 'abc'],
+            'Hours_Per_Month': [173, 173],
+            'Employee_Type': ['Employee', 'Employee'],
+            'Company': ['Skyward IT Solutions', 'Skyward IT Solutions'],
+            'Status': ['Active', 'Active']
+        })
+        
+        is_valid, errors = validate_employee_data(df)
+        
+        # 'abc' coerces to NaN and should be reported
+        assert is_valid is False
+        assert errors == ["Current salary must be non-negative numbers"]
+    
     def test_validate_subcontractor_data_valid(self, sample_subcontractors_data):
         """Test subcontractor data validation with valid data"""
         is_valid, errors = validate_subcontractor_data(sample_subcontractors_data)
@@ -5,19 +5,40 @@ import streamlit as st
 from typing import List, Dict, Any, Callable
 import pandas as pd
 
+# Card template for MetricCard
+_METRIC_CARD_HTML = """
+        <div class="metric-card" style="text-align: center;">
+            <div class="metric-icon">{icon}</div>
+            <div class="metric-value" style="color: {color};">{value}</div>
+            <div class="metric-label">{label}</div>
+        </div>
+        """
+
+# Equal-width column specs for FormSection, keyed by column count
+_COL_SPECS = {n: (1,) * n for n in range(1, 5)}
+
+# Row templates for FinancialCard
+_FINANCIAL_ITEM_HTML = """
+                <div class="financial-item">
+                    <span>{label}</span>
+                    <strong>{value}</strong>
+                </div>
+                """
+
+_FINANCIAL_TOTAL_ITEM_HTML = """
+                <div class="financial-item">
+                    <span>{label}</span>
+                    <strong style="color: {color};">{value}</strong>
+                </div>
+                """
+
 class MetricCard:
     """Reusable metric card component"""
     
     @staticmethod
     def render(icon: str, value: str, label: str, color: str = "#2E5BBA") -> None:
         """Render a metric card"""
-        st.markdown(f"""
-        <div class="metric-card" style="text-align: center;">
-            <div class="metric-icon">{icon}</div>
-            <div class="metric-value" style="color: {color};">{value}</div>
-            <div class="metric-label">{label}</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.html(_METRIC_CARD_HTML.format(icon=icon, value=value, label=label, color=color))
 
 class FinancialCard:
     """Reusable financial information card"""
@@ -25,29 +46,22 @@ class FinancialCard:
     @staticmethod
     def render(title: str, items: List[Dict[str, Any]], is_total: bool = False) -> None:
         """Render a financial card"""
-        items_html = ""
-        for item in items:
-            if is_total and item == items[-1]:
-                items_html += f"""
-                <div class="financial-item">
-                    <span>{item['label']}</span>
-                    <strong style="color: {item.get('color', '#2E5BBA')};">{item['value']}</strong>
-                </div>
-                """
-            else:
-                items_html += f"""
-                <div class="financial-item">
-                    <span>{item['label']}</span>
-                    <strong>{item['value']}</strong>
-                </div>
-                """
+        # Only the last row of a total card gets the highlight color
+        last_idx = len(items) - 1 if is_total else -1
+        items_html = "".join(
+            _FINANCIAL_TOTAL_ITEM_HTML.format(label=item['label'], value=item['value'],
+                                              color=item.get('color', '#2E5BBA'))
+            if i == last_idx else
+            _FINANCIAL_ITEM_HTML.format(label=item['label'], value=item['value'])
+            for i, item in enumerate(items)
+        )
         
-        st.markdown(f"""
+        st.html(f"""
         <div class="financial-card">
             <h3>{title}</h3>
             {items_html}
         </div>
-        """, unsafe_allow_html=True)
+        """)
 
 class RemovalInterface:
     """Reusable removal interface component"""
@@ -71,20 +85,28 @@ class RemovalInterface:
         
         st.write("Select items to remove from the project:")
         
+        # Widget key prefix derived from the title
+        slug = title.lower().replace(' ', '_')
+        
+        # Map each display label to its item once; the first item wins for duplicate labels
+        display_map = {}
+        for item in items:
+            display_map.setdefault(item_display_func(item), item)
+        
         # Individual removal
         col1, col2, col3 = st.columns([2, 1, 1])
         
         with col1:
             selected_item = st.selectbox(
                 f"Choose item to remove:",
-                options=[item_display_func(item) for item in items],
-                key=f"{title.lower().replace(' ', '_')}_removal_select"
+                options=list(display_map),
+                key=f"{slug}_removal_select"
             )
         
         with col2:
             if selected_item:
                 # Find the actual item object
-                selected_obj = next((item for item in items if item_display_func(item) == selected_item), None)
+                selected_obj = display_map.get(selected_item)
                 if selected_obj:
                     details = item_details_func(selected_obj)
                     for key, value in details.items():
@@ -92,8 +114,8 @@ class RemovalInterface:
         
         with col3:
             if selected_item:
-                if st.button("🗑️ Remove", type="secondary", key=f"remove_{title.lower().replace(' ', '_')}_btn"):
-                    selected_obj = next((item for item in items if item_display_func(item) == selected_item), None)
+                if st.button("🗑️ Remove", type="secondary", key=f"remove_{slug}_btn"):
+                    selected_obj = display_map.get(selected_item)
                     if selected_obj:
                         on_remove(selected_obj)
                         st.success(f"✅ Item has been removed successfully.")
@@ -149,13 +171,13 @@ class ChartContainer:
     @staticmethod
     def render(chart_func: Callable, *args, **kwargs) -> None:
         """Render a chart in a styled container"""
-        st.markdown("""
+        st.html("""
         <div class="stPlotlyChart">
-        """, unsafe_allow_html=True)
+        """)
         
         chart_func(*args, **kwargs)
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.html("</div>")
 
 class FormSection:
     """Reusable form section component"""
@@ -163,15 +185,13 @@ class FormSection:
     @staticmethod
     def render(title: str, columns: int = 3):
         """Render a form section with expandable interface"""
-        with st.expander(f"➕ {title}", expanded=False):
-            return st.columns(columns)
+        return FormSection.create_expandable(title, columns)
     
     @staticmethod
     def create_expandable(title: str, columns: int = 3):
         """Create an expandable section and return columns"""
-        expander = st.expander(f"➕ {title}", expanded=False)
-        with expander:
-            return st.columns(columns)
+        with st.expander(f"➕ {title}", expanded=False):
+            return st.columns(_COL_SPECS.get(columns, columns))
 
 class SuccessMessage:
     """Reusable success message component"""
@@ -179,7 +199,7 @@ class SuccessMessage:
     @staticmethod
     def render(message: str) -> None:
         """Render a success message"""
-        st.success(f"✅ {message}")
+        st.success("✅ " + message)
 
 class ErrorMessage:
     """Reusable error message component"""
@@ -187,7 +207,7 @@ class ErrorMessage:
     @staticmethod
     def render(message: str) -> None:
         """Render an error message"""
-        st.error(f"❌ {message}")
+        st.error("❌ " + message)
 
 class WarningMessage:
     """Reusable warning message component"""
@@ -195,7 +215,7 @@ class WarningMessage:
     @staticmethod
     def render(message: str) -> None:
         """Render a warning message"""
-        st.warning(f"⚠️ {message}")
+        st.warning("⚠️ " + message)
 
 class InfoMessage:
     """Reusable info message component"""
@@ -203,4 +223,4 @@ class InfoMessage:
     @staticmethod
     def render(message: str) -> None:
         """Render an info message"""
-        st.info(f"📊 {message}")
+        st.info("📊 " + message)
@@ -5,88 +5,159 @@ Provides granular permissions and data access control
 
 import streamlit as st
 import pandas as pd
+import copy
+import functools
 import json
+import re
+from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Pattern, Sequence
 from auth import AuthManager, check_permission
 
 
+# Maximum number of entries kept in a session's data access log
+_ACCESS_LOG_LIMIT = 1000
+
+# Column-name patterns for each category of sensitive data
+_SENSITIVE_PATTERNS: Dict[str, Pattern[str]] = {
+    'salary': re.compile('Current_Salary|Priced_Salary|Hourly_Rate'),
+    'personal_info': re.compile('Email|Phone|Address|SSN'),
+    'financial_data': re.compile('Revenue_|Cost_|Profit_')
+}
+
+# Access log columns with few distinct values, stored as categoricals for display
+_LOG_CATEGORY_DTYPES = {column: 'category' for column in ('username', 'data_type', 'action', 'ip_address')}
+
+# Timestamp recorded for the built-in accounts, captured once at import
+_INIT_TS = datetime.now().isoformat()
+
+# Built-in accounts and role permissions; shared, so treat as read-only
+_DEFAULT_USERS: Dict[str, Dict[str, Any]] = {
+    'admin': {
+        'username': 'admin',
+        'full_name': 'System Administrator',
+        'email': 'admin@seas.com',
+        'role': 'admin',
+        'department': 'IT',
+        'created_date': _INIT_TS,
+        'last_login': None,
+        'status': 'active',
+        'permissions': ['all']
+    },
+    'manager': {
+        'username': 'manager',
+        'full_name': 'Project Manager',
+        'email': 'manager@seas.com',
+        'role': 'manager',
+        'department': 'Project Management',
+        'created_date': _INIT_TS,
+        'last_login': None,
+        'status': 'active',
+        'permissions': ['view', 'edit', 'export', 'import']
+    },
+    'viewer': {
+        'username': 'viewer',
+        'full_name': 'Financial Viewer',
+        'email': 'viewer@seas.com',
+        'role': 'viewer',
+        'department': 'Finance',
+        'created_date': _INIT_TS,
+        'last_login': None,
+        'status': 'active',
+        'permissions': ['view', 'export']
+    }
+}
+
+_DEFAULT_PERMISSIONS: Dict[str, Dict[str, List[str]]] = {
+    'admin': {
+        'data_access': ['all'],
+        'sensitive_data': ['salary', 'personal_info', 'financial_data'],
+        'operations': ['create', 'read', 'update', 'delete', 'export', 'import', 'manage_users'],
+        'reports': ['all_reports', 'financial_summary', 'employee_data', 'cost_analysis']
+    },
+    'manager': {
+        'data_access': ['employees', 'subcontractors', 'projects', 'tasks'],
+        'sensitive_data': ['salary'],  # Limited salary access
+        'operations': ['create', 'read', 'update', 'export', 'import'],
+        'reports': ['financial_summary', 'employee_data', 'cost_analysis']
+    },
+    'viewer': {
+        'data_access': ['employees', 'subcontractors', 'projects'],
+        'sensitive_data': [],  # No sensitive data access
+        'operations': ['read', 'export'],
+        'reports': ['financial_summary', 'cost_analysis']
+    }
+}
+
+# Display table of the built-in accounts for the users tab
+_USERS_DISPLAY_DF = pd.DataFrame(
+    {
+        label: [user[field] for user in _DEFAULT_USERS.values()]
+        for label, field in (('Username', 'username'), ('Full Name', 'full_name'), ('Role', 'role'),
+                             ('Department', 'department'), ('Status', 'status'))
+    },
+    index=list(_DEFAULT_USERS)
+)
+
+# Bullet lists for the permissions tab, one markdown string per role and section
+_PERMISSIONS_RENDERED: Dict[str, Dict[str, str]] = {
+    role: {
+        section: "\n\n".join(f"• {item}" for item in items)
+        for section, items in permissions.items()
+    }
+    for role, permissions in _DEFAULT_PERMISSIONS.items()
+}
+
+# Per-role access sets derived from the defaults for O(1) membership checks;
+# these are the authoritative permission tables and are read-only
+_ROLE_DATA_ACCESS: Dict[str, FrozenSet[str]] = {
+    role: frozenset(permissions['data_access']) for role, permissions in _DEFAULT_PERMISSIONS.items()
+}
+
+_ROLE_SENSITIVE_DATA: Dict[str, FrozenSet[str]] = {
+    role: frozenset(permissions['sensitive_data']) for role, permissions in _DEFAULT_PERMISSIONS.items()
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _column_categories(column: str) -> FrozenSet[str]:
+    """Get the sensitive categories a column name falls under"""
+    return frozenset(sensitive_type for sensitive_type, pattern in _SENSITIVE_PATTERNS.items()
+                     if pattern.search(column))
+
+
 class UserManager:
     """Manages users, roles, and permissions"""
     
+    __slots__ = ('auth_manager',)
+    
     def __init__(self):
         self.auth_manager = AuthManager()
+    
+    def ensure_session(self):
+        """Make sure the current session has its user management data"""
         self.initialize_user_data()
     
     def initialize_user_data(self):
         """Initialize user management data in session state"""
-        if 'users' not in st.session_state:
-            st.session_state.users = self.get_default_users()
-        if 'user_permissions' not in st.session_state:
-            st.session_state.user_permissions = self.get_default_permissions()
-        if 'data_access_log' not in st.session_state:
-            st.session_state.data_access_log = []
+        # A single sentinel keeps the steady-state check to one lookup
+        if st.session_state.get('_um_initialized'):
+            return
+        
+        # Each session gets its own copy so edits never leak into the shared defaults.
+        # Role permissions are not copied: checks read the module-level role sets.
+        st.session_state.users = copy.deepcopy(_DEFAULT_USERS)
+        st.session_state.data_access_log = deque(maxlen=_ACCESS_LOG_LIMIT)
+        st.session_state._um_initialized = True
     
     def get_default_users(self) -> Dict[str, Dict[str, Any]]:
-        """Get default user configurations"""
-        return {
-            'admin': {
-                'username': 'admin',
-                'full_name': 'System Administrator',
-                'email': 'admin@seas.com',
-                'role': 'admin',
-                'department': 'IT',
-                'created_date': datetime.now().isoformat(),
-                'last_login': None,
-                'status': 'active',
-                'permissions': ['all']
-            },
-            'manager': {
-                'username': 'manager',
-                'full_name': 'Project Manager',
-                'email': 'manager@seas.com',
-                'role': 'manager',
-                'department': 'Project Management',
-                'created_date': datetime.now().isoformat(),
-                'last_login': None,
-                'status': 'active',
-                'permissions': ['view', 'edit', 'export', 'import']
-            },
-            'viewer': {
-                'username': 'viewer',
-                'full_name': 'Financial Viewer',
-                'email': 'viewer@seas.com',
-                'role': 'viewer',
-                'department': 'Finance',
-                'created_date': datetime.now().isoformat(),
-                'last_login': None,
-                'status': 'active',
-                'permissions': ['view', 'export']
-            }
-        }
+        """Get default user configurations (shared, read-only)"""
+        return _DEFAULT_USERS
     
     def get_default_permissions(self) -> Dict[str, Dict[str, List[str]]]:
-        """Get default permission configurations"""
-        return {
-            'admin': {
-                'data_access': ['all'],
-                'sensitive_data': ['salary', 'personal_info', 'financial_data'],
-                'operations': ['create', 'read', 'update', 'delete', 'export', 'import', 'manage_users'],
-                'reports': ['all_reports', 'financial_summary', 'employee_data', 'cost_analysis']
-            },
-            'manager': {
-                'data_access': ['employees', 'subcontractors', 'projects', 'tasks'],
-                'sensitive_data': ['salary'],  # Limited salary access
-                'operations': ['create', 'read', 'update', 'export', 'import'],
-                'reports': ['financial_summary', 'employee_data', 'cost_analysis']
-            },
-            'viewer': {
-                'data_access': ['employees', 'subcontractors', 'projects'],
-                'sensitive_data': [],  # No sensitive data access
-                'operations': ['read', 'export'],
-                'reports': ['financial_summary', 'cost_analysis']
-            }
-        }
+        """Get default permission configurations (shared, read-only)"""
+        return _DEFAULT_PERMISSIONS
     
     def get_current_user_info(self) -> Dict[str, Any]:
         """Get current user information"""
@@ -101,11 +172,8 @@ class UserManager:
         if not self.auth_manager.is_authenticated():
             return False
         
-        user_info = self.get_current_user_info()
-        role = user_info.get('role', 'viewer')
-        permissions = st.session_state.user_permissions.get(role, {})
-        
-        data_access = permissions.get('data_access', [])
+        role = self.get_current_user_info().get('role', 'viewer')
+        data_access = _ROLE_DATA_ACCESS.get(role, frozenset())
         return 'all' in data_access or data_type in data_access
     
     def has_sensitive_data_access(self, data_type: str) -> bool:
@@ -113,12 +181,8 @@ class UserManager:
         if not self.auth_manager.is_authenticated():
             return False
         
-        user_info = self.get_current_user_info()
-        role = user_info.get('role', 'viewer')
-        permissions = st.session_state.user_permissions.get(role, {})
-        
-        sensitive_data = permissions.get('sensitive_data', [])
-        return data_type in sensitive_data
+        role = self.get_current_user_info().get('role', 'viewer')
+        return data_type in _ROLE_SENSITIVE_DATA.get(role, frozenset())
     
     def log_data_access(self, data_type: str, action: str, details: str = ""):
         """Log data access for audit purposes"""
@@ -137,37 +201,30 @@ class UserManager:
             'ip_address': 'streamlit_cloud'  # Placeholder for IP
         }
         
+        # The deque drops the oldest entry once the limit is reached
         st.session_state.data_access_log.append(log_entry)
-        
-        # Keep only last 1000 entries
-        if len(st.session_state.data_access_log) > 1000:
-            st.session_state.data_access_log = st.session_state.data_access_log[-1000:]
     
     def filter_sensitive_data(self, df: pd.DataFrame, data_type: str) -> pd.DataFrame:
-        """Filter sensitive data based on user permissions"""
+        """Filter sensitive data based on user permissions; returns ``df`` itself when nothing is masked"""
         if not self.auth_manager.is_authenticated():
             return df
         
         # Log the data access
         self.log_data_access(data_type, 'view', f"Accessed {len(df)} records")
         
-        # Create a copy to avoid modifying original
-        filtered_df = df.copy()
-        
-        # Remove sensitive columns based on permissions
-        sensitive_columns = {
-            'salary': ['Current_Salary', 'Priced_Salary', 'Hourly_Rate'],
-            'personal_info': ['Email', 'Phone', 'Address', 'SSN'],
-            'financial_data': ['Revenue_', 'Cost_', 'Profit_']
-        }
+        # Mask every column matching a sensitive type the user may not see
+        denied = frozenset(sensitive_type for sensitive_type in _SENSITIVE_PATTERNS
+                           if not self.has_sensitive_data_access(sensitive_type))
+        if not denied:
+            return df
         
-        for sensitive_type, columns in sensitive_columns.items():
-            if not self.has_sensitive_data_access(sensitive_type):
-                # Find columns that match the pattern
-                for col in filtered_df.columns:
-                    if any(pattern in col for pattern in columns):
-                        filtered_df[col] = '*** Restricted ***'
+        restricted = [col for col in df.columns if _column_categories(col) & denied]
+        if not restricted:
+            return df
         
+        # Copy only when something is masked, so the original stays untouched
+        filtered_df = df.copy()
+        filtered_df[restricted] = '*** Restricted ***'
         return filtered_df
     
     def get_user_role_display(self) -> str:
@@ -184,13 +241,26 @@ class UserManager:
         return role_display.get(role, '👤 User')
 
 
+@st.cache_resource
+def _get_user_manager() -> UserManager:
+    """Create the process-wide UserManager once"""
+    return UserManager()
+
+
+def get_user_manager() -> UserManager:
+    """Get the shared UserManager with the current session initialized"""
+    user_manager = _get_user_manager()
+    user_manager.ensure_session()
+    return user_manager
+
+
 def render_user_management_page():
     """Render the user management interface"""
     if not check_permission('manage_users'):
         st.error("🔒 You don't have permission to manage users. Contact your administrator.")
         return
     
-    user_manager = UserManager()
+    user_manager = get_user_manager()
     
     st.markdown("## 👥 User Management")
     st.markdown("Manage users, roles, and permissions for the SEAS Financial Tracker.")
@@ -216,13 +286,7 @@ def render_users_tab(user_manager: UserManager):
     st.markdown("### User Accounts")
     
     # Display current users
-    users_df = pd.DataFrame.from_dict(user_manager.get_default_users(), orient='index')
-    
-    # Format the dataframe for display
-    display_df = users_df[['username', 'full_name', 'role', 'department', 'status']].copy()
-    display_df.columns = ['Username', 'Full Name', 'Role', 'Department', 'Status']
-    
-    st.dataframe(display_df, use_container_width=True)
+    st.dataframe(_USERS_DISPLAY_DF, use_container_width=True)
     
     # Add new user form
     with st.expander("➕ Add New User", expanded=False):
@@ -250,29 +314,37 @@ def render_permissions_tab(user_manager: UserManager):
     """Render the permissions management tab"""
     st.markdown("### Role-Based Permissions")
     
-    permissions = user_manager.get_default_permissions()
-    
-    for role, role_permissions in permissions.items():
+    for role, sections in _PERMISSIONS_RENDERED.items():
         with st.expander(f"🔐 {role.title()} Permissions", expanded=False):
             col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown("**Data Access:**")
-                for data_type in role_permissions.get('data_access', []):
-                    st.markdown(f"• {data_type}")
-                
-                st.markdown("**Sensitive Data:**")
-                for data_type in role_permissions.get('sensitive_data', []):
-                    st.markdown(f"• {data_type}")
+                _render_permission_section("**Data Access:**", sections['data_access'])
+                _render_permission_section("**Sensitive Data:**", sections['sensitive_data'])
             
             with col2:
-                st.markdown("**Operations:**")
-                for operation in role_permissions.get('operations', []):
-                    st.markdown(f"• {operation}")
-                
-                st.markdown("**Reports:**")
-                for report in role_permissions.get('reports', []):
-                    st.markdown(f"• {report}")
+                _render_permission_section("**Operations:**", sections['operations'])
+                _render_permission_section("**Reports:**", sections['reports'])
+
+
+def _render_permission_section(heading: str, items_md: str):
+    """Render a permission heading and its pre-joined bullet list"""
+    st.markdown(heading)
+    if items_md:
+        st.markdown(items_md)
+
+
+def _access_log_csv(access_log: Sequence[Dict[str, str]]) -> str:
+    """Serialize the access log to CSV, reusing this session's last export while the log is unchanged"""
+    key = (len(access_log), access_log[-1]['timestamp'])
+    cached = st.session_state.get('_access_log_csv')
+    if cached is None or cached[0] != key:
+        # Newest first, matching the on-screen table
+        log_df = pd.DataFrame(list(reversed(access_log))).astype(_LOG_CATEGORY_DTYPES)
+        log_df['timestamp'] = pd.to_datetime(log_df['timestamp'])
+        cached = (key, log_df.to_csv(index=False))
+        st.session_state._access_log_csv = cached
+    return cached[1]
 
 
 def render_access_log_tab(user_manager: UserManager):
@@ -283,17 +355,16 @@ def render_access_log_tab(user_manager: UserManager):
     access_log = st.session_state.get('data_access_log', [])
     
     if access_log:
-        # Convert to DataFrame for better display
-        log_df = pd.DataFrame(access_log)
-        log_df['timestamp'] = pd.to_datetime(log_df['timestamp'])
-        log_df = log_df.sort_values('timestamp', ascending=False)
+        # Entries are appended in time order, so the newest 50 are simply the last 50
+        recent = list(islice(reversed(access_log), 50))
+        log_df = pd.DataFrame(recent).astype(_LOG_CATEGORY_DTYPES)
         
         # Display recent entries
-        st.dataframe(log_df.head(50), use_container_width=True)
+        st.dataframe(log_df, use_container_width=True)
         
         # Export log
         if st.button("📥 Export Access Log"):
-            csv = log_df.to_csv(index=False)
+            csv = _access_log_csv(access_log)
             st.download_button(
                 label="Download CSV",
                 data=csv,
@@ -329,7 +400,7 @@ def render_settings_tab(user_manager: UserManager):
 def render_user_info_sidebar():
     """Render user information in sidebar"""
     if st.session_state.get('authenticated', False):
-        user_manager = UserManager()
+        user_manager = get_user_manager()
         user_info = user_manager.get_current_user_info()
         
         with st.sidebar:
@@ -366,10 +437,16 @@ def render_user_info_sidebar():
 
 def get_data_access_warning(data_type: str) -> str:
     """Get appropriate warning message for data access"""
-    user_manager = UserManager()
+    denied = f"🔒 You don't have permission to access {data_type} data."
+    
+    # Logged-out users have no access, so skip the manager entirely
+    if not st.session_state.get('authenticated', False):
+        return denied
+    
+    user_manager = get_user_manager()
     
     if not user_manager.has_data_access(data_type):
-        return f"🔒 You don't have permission to access {data_type} data."
+        return denied
     
     if not user_manager.has_sensitive_data_access('salary') and 'salary' in data_type.lower():
         return f"⚠️ Salary information is restricted. Contact your administrator for access."
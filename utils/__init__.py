@@ -2,9 +2,10 @@
 Utility modules for SEAS Financial Tracker
 """
 
-from .template_downloader import generate_employee_template, get_template_info
+from .template_downloader import generate_employee_template, get_template_info, warm_template_cache
 
 __all__ = [
     "generate_employee_template",
-    "get_template_info"
+    "get_template_info",
+    "warm_template_cache"
 ]
@@ -3,12 +3,158 @@ Template Download Utility for SEAS Financial Tracker
 Provides functions to generate and serve templates for download
 """
 
-import pandas as pd
+import xlsxwriter
+import functools
 import io
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, Tuple
 
+# Monthly periods for the base year and option year one
+_BASE_YEAR_PERIODS = (
+    '03/13/2024-04/11/2024', '04/12/2024-05/11/2024', '05/12/2024-06/10/2024', '06/11/2024-07/10/2024',
+    '07/11/2024-08/09/2024', '08/10/2024-09/08/2024', '09/09/2024-10/08/2024', '10/09/2024-11/07/2024',
+    '11/08/2024-12/07/2024', '12/08/2024-01/06/2025', '01/07/2025-02/05/2025', '02/06/2025-03/07/2025'
+)
+
+_OPTION_YEAR_PERIODS = (
+    '03/08/2025-04/07/2025', '04/08/2025-05/07/2025', '05/08/2025-06/06/2025', '06/07/2025-07/06/2025',
+    '07/07/2025-08/05/2025', '08/06/2025-09/04/2025', '09/05/2025-10/04/2025', '10/05/2025-11/03/2025',
+    '11/04/2025-12/03/2025', '12/04/2025-01/02/2026', '01/03/2026-02/01/2026', '02/02/2026-03/03/2026'
+)
+
+_ALL_PERIODS = _BASE_YEAR_PERIODS + _OPTION_YEAR_PERIODS
+
+# Hours and Revenue column pairs for every period, in template order
+_PERIOD_COLUMNS = tuple(
+    column
+    for period in _ALL_PERIODS
+    for column in (f'Hours_{period}', f'Revenue_{period}')
+)
+
+# Blank hours and revenue values appended to every sample employee row
+_ZERO_ROW = (0.0,) * len(_PERIOD_COLUMNS)
+
+# Employee fields ahead of the period columns in each template
+_BASIC_FIELDS = (
+    'Name', 'LCAT', 'Employee_Type', 'Company', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Status'
+)
+
+_COMPREHENSIVE_FIELDS = _BASIC_FIELDS + ('Department', 'Start_Date', 'Location', 'Manager', 'Skills')
+
+# Sample employees, one tuple per row in field order
+_BASIC_ROWS = (
+    ('John Smith', 'PM', 'Employee', 'Skyward IT Solutions', 150000, 160000, 173, 'Active'),
+    ('Jane Doe', 'SA/Eng Lead', 'Employee', 'Skyward IT Solutions', 180000, 175000, 173, 'Active'),
+    ('Bob Johnson', 'AI Lead', 'Subcontractor', 'BEELINE', 200000, 250000, 173, 'Active')
+)
+
+_COMPREHENSIVE_ROWS = (
+    ('Shannon Gueringer', 'PM', 'Employee', 'Skyward IT Solutions', 160000, 200000, 173, 'Active',
+     'Management', '2024-01-15', 'Remote', 'Program Director', 'Project Management, Leadership'),
+    ('Drew Hynes', 'PM', 'Employee', 'Skyward IT Solutions', 0, 0, 173, 'Inactive',
+     'Management', '2024-02-01', 'Remote', 'Program Director', 'Project Management'),
+    ('Uyen Tran', 'SA/Eng Lead', 'Employee', 'Skyward IT Solutions', 180000, 175000, 173, 'Active',
+     'Engineering', '2024-01-20', 'Remote', 'Technical Lead', 'Software Architecture'),
+    ('Leo Khan', 'SA/Eng Lead', 'Employee', 'Skyward IT Solutions', 180000, 190000, 173, 'Active',
+     'Engineering', '2024-01-25', 'Remote', 'Technical Lead', 'Software Architecture'),
+    ('Vitaliy Baklikov', 'AI Lead', 'Employee', 'Skyward IT Solutions', 200000, 250000, 173, 'Active',
+     'AI/ML', '2024-01-10', 'Remote', 'Technical Lead', 'AI/ML, Data Science')
+)
+
+# Template metadata, shared by every get_template_info() caller
+_TEMPLATE_INFO = {
+    "basic": {
+        "name": "Basic Employee Template",
+        "description": f"{len(_BASIC_FIELDS)} required fields + monthly hours/revenue columns",
+        "fields": len(_BASIC_FIELDS) + len(_PERIOD_COLUMNS),
+        "recommended_for": "Quick employee data entry"
+    },
+    "comprehensive": {
+        "name": "Comprehensive Employee Template",
+        "description": f"{len(_COMPREHENSIVE_FIELDS)} fields + monthly hours/revenue columns + instructions",
+        "fields": len(_COMPREHENSIVE_FIELDS) + len(_PERIOD_COLUMNS),
+        "recommended_for": "Detailed employee management"
+    }
+}
+
+# Static instruction sheets as (Field, Required, Description) rows
+_INSTRUCTIONS_HEADER = ('Field', 'Required', 'Description')
+
+_BASIC_INSTRUCTIONS = (
+    ('Name', 'Yes', 'Full name of the employee'),
+    ('LCAT', 'Yes', 'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)'),
+    ('Employee_Type', 'Yes', 'Employee type (Employee or Subcontractor)'),
+    ('Company', 'Yes', 'Company name (Skyward IT Solutions for employees, BEELINE/Self Employed/Aquia/Friends for subcontractors)'),
+    ('Priced_Salary', 'Yes', 'Original budgeted salary for the project'),
+    ('Current_Salary', 'Yes', 'Current actual salary being paid'),
+    ('Hours_Per_Month', 'Yes', 'Standard hours worked per month (typically 173)'),
+    ('Status', 'Yes', 'Employee status (Active or Inactive)')
+)
+
+_COMPREHENSIVE_INSTRUCTIONS = (
+    ('Name', 'Yes', 'Full name of the employee'),
+    ('LCAT', 'Yes', 'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)'),
+    ('Priced_Salary', 'Yes', 'Original budgeted salary for the project'),
+    ('Current_Salary', 'Yes', 'Current actual salary being paid'),
+    ('Hours_Per_Month', 'Yes', 'Standard hours worked per month (typically 173)'),
+    ('Status', 'Yes', 'Employee status (Active or Inactive)'),
+    ('Department', 'No', 'Department or team assignment'),
+    ('Start_Date', 'No', 'Employee start date (YYYY-MM-DD format)'),
+    ('Location', 'No', 'Work location (Remote, On-site, Hybrid)'),
+    ('Manager', 'No', 'Direct manager or supervisor'),
+    ('Skills', 'No', 'Key skills and competencies (comma-separated)')
+)
+
+# Allowed values for each validated column; lists may differ in length
+_VALIDATION_OPTIONS = {
+    'LCAT_Options': ('PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'),
+    'Department_Options': ('Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'),
+    'Location_Options': ('Remote', 'On-site', 'Hybrid', 'Travel'),
+    'Status_Options': ('Active', 'Inactive')
+}
+
+# Worker threads are only started on the first warm-up submit
+_WARMUP_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='template-warmup')
+
+# Date stamp of the last warm-up, so reruns on the same day submit nothing
+_warmed_date = ''
+
+# Today's date stamp and the local midnight (epoch seconds) it expires at
+_date_cache = [0.0, '']
+
+# Header cell style matching pandas' default to_excel header
+_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+def _write_sheet(workbook, sheet_name: str, header, rows, header_format) -> None:
+    """Write a header and data rows to a new worksheet"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, header, header_format)
+    for row_num, row in enumerate(rows, start=1):
+        worksheet.write_row(row_num, 0, row)
+
+def _write_columns(workbook, sheet_name: str, columns: Dict[str, Tuple[str, ...]], header_format) -> None:
+    """Write each option list down its own column, leaving short columns blank"""
+    worksheet = workbook.add_worksheet(sheet_name)
+    for col_num, (header, values) in enumerate(columns.items()):
+        worksheet.write(0, col_num, header, header_format)
+        worksheet.write_column(1, col_num, values)
+
+def _write_employee_sheet(workbook, fields: Tuple[str, ...], rows, header_format) -> None:
+    """Write sample employees followed by zeroed hours/revenue columns"""
+    _write_sheet(workbook, 'Employee_Data', fields + _PERIOD_COLUMNS,
+                 (row + _ZERO_ROW for row in rows), header_format)
+
+def _today_str() -> str:
+    """Return today's YYYYMMDD stamp, reformatting only after local midnight"""
+    if time.time() >= _date_cache[0]:
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        _date_cache[:] = [midnight.timestamp(), now.strftime('%Y%m%d')]
+    return _date_cache[1]
+
 def generate_employee_template(template_type: str = "comprehensive") -> Tuple[bytes, str]:
     """
     Generate employee template for download
@@ -20,182 +166,72 @@ def generate_employee_template(template_type: str = "comprehensive") -> Tuple[by
         Tuple of (file_bytes, filename)
     """
     
+    # The date is part of the cache key so the filename rolls over at midnight
+    date_str = _today_str()
     if template_type == "basic":
-        return _generate_basic_template()
+        return _generate_basic_template(date_str)
     else:
-        return _generate_comprehensive_template()
+        return _generate_comprehensive_template(date_str)
+
+def warm_template_cache() -> None:
+    """Build today's templates in the background so downloads hit the cache"""
+    global _warmed_date
+    date_str = _today_str()
+    if date_str == _warmed_date:
+        return
+    _warmed_date = date_str
+    for template_type in ("basic", "comprehensive"):
+        _WARMUP_EXECUTOR.submit(generate_employee_template, template_type)
+
+def clear_template_cache() -> None:
+    """Drop cached template bytes, e.g. after a template schema change"""
+    global _warmed_date
+    _warmed_date = ''
+    _generate_basic_template.cache_clear()
+    _generate_comprehensive_template.cache_clear()
 
-def _generate_basic_template() -> Tuple[bytes, str]:
+@functools.lru_cache(maxsize=8)
+def _generate_basic_template(date_str: str) -> Tuple[bytes, str]:
     """Generate basic employee template"""
     
-    # Core employee data
-    data = {
-        'Name': ['John Smith', 'Jane Doe', 'Bob Johnson'],
-        'LCAT': ['PM', 'SA/Eng Lead', 'AI Lead'],
-        'Employee_Type': ['Employee', 'Employee', 'Subcontractor'],
-        'Company': ['Skyward IT Solutions', 'Skyward IT Solutions', 'BEELINE'],
-        'Priced_Salary': [150000, 180000, 200000],
-        'Current_Salary': [160000, 175000, 250000],
-        'Hours_Per_Month': [173, 173, 173],
-        'Status': ['Active', 'Active', 'Active']
-    }
-    
-    df = pd.DataFrame(data)
-    
-    # Add monthly hours columns for base year and option year one
-    base_year_periods = [
-        '03/13/2024-04/11/2024', '04/12/2024-05/11/2024', '05/12/2024-06/10/2024', '06/11/2024-07/10/2024',
-        '07/11/2024-08/09/2024', '08/10/2024-09/08/2024', '09/09/2024-10/08/2024', '10/09/2024-11/07/2024',
-        '11/08/2024-12/07/2024', '12/08/2024-01/06/2025', '01/07/2025-02/05/2025', '02/06/2025-03/07/2025'
-    ]
-    
-    option_year_periods = [
-        '03/08/2025-04/07/2025', '04/08/2025-05/07/2025', '05/08/2025-06/06/2025', '06/07/2025-07/06/2025',
-        '07/07/2025-08/05/2025', '08/06/2025-09/04/2025', '09/05/2025-10/04/2025', '10/05/2025-11/03/2025',
-        '11/04/2025-12/03/2025', '12/04/2025-01/02/2026', '01/03/2026-02/01/2026', '02/02/2026-03/03/2026'
-    ]
-    
-    # Add Hours and Revenue columns for all periods
-    for period in base_year_periods + option_year_periods:
-        df[f'Hours_{period}'] = 0.0
-        df[f'Revenue_{period}'] = 0.0
-    
     # Generate Excel file
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Employee_Data', index=False)
+    with xlsxwriter.Workbook(output, {'in_memory': True}) as workbook:
+        header_format = workbook.add_format(_HEADER_FORMAT)
+        _write_employee_sheet(workbook, _BASIC_FIELDS, _BASIC_ROWS, header_format)
         
         # Add instructions sheet
-        instructions = {
-            'Field': ['Name', 'LCAT', 'Employee_Type', 'Company', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Status'],
-            'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes'],
-            'Description': [
-                'Full name of the employee',
-                'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
-                'Employee type (Employee or Subcontractor)',
-                'Company name (Skyward IT Solutions for employees, BEELINE/Self Employed/Aquia/Friends for subcontractors)',
-                'Original budgeted salary for the project',
-                'Current actual salary being paid',
-                'Standard hours worked per month (typically 173)',
-                'Employee status (Active or Inactive)'
-            ]
-        }
-        
-        instructions_df = pd.DataFrame(instructions)
-        instructions_df.to_excel(writer, sheet_name='Instructions', index=False)
+        _write_sheet(workbook, 'Instructions', _INSTRUCTIONS_HEADER, _BASIC_INSTRUCTIONS, header_format)
     
-    output.seek(0)
     file_bytes = output.getvalue()
-    filename = f"employee_template_basic_{datetime.now().strftime('%Y%m%d')}.xlsx"
+    filename = f"employee_template_basic_{date_str}.xlsx"
     
     return file_bytes, filename
 
-def _generate_comprehensive_template() -> Tuple[bytes, str]:
+@functools.lru_cache(maxsize=8)
+def _generate_comprehensive_template(date_str: str) -> Tuple[bytes, str]:
     """Generate comprehensive employee template"""
     
-    # Comprehensive employee data
-    data = {
-        'Name': ['Shannon Gueringer', 'Drew Hynes', 'Uyen Tran', 'Leo Khan', 'Vitaliy Baklikov'],
-        'LCAT': ['PM', 'PM', 'SA/Eng Lead', 'SA/Eng Lead', 'AI Lead'],
-        'Employee_Type': ['Employee', 'Employee', 'Employee', 'Employee', 'Employee'],
-        'Company': ['Skyward IT Solutions', 'Skyward IT Solutions', 'Skyward IT Solutions', 'Skyward IT Solutions', 'Skyward IT Solutions'],
-        'Priced_Salary': [160000, 0, 180000, 180000, 200000],
-        'Current_Salary': [200000, 0, 175000, 190000, 250000],
-        'Hours_Per_Month': [173, 173, 173, 173, 173],
-        'Status': ['Active', 'Inactive', 'Active', 'Active', 'Active'],
-        'Department': ['Management', 'Management', 'Engineering', 'Engineering', 'AI/ML'],
-        'Start_Date': ['2024-01-15', '2024-02-01', '2024-01-20', '2024-01-25', '2024-01-10'],
-        'Location': ['Remote', 'Remote', 'Remote', 'Remote', 'Remote'],
-        'Manager': ['Program Director', 'Program Director', 'Technical Lead', 'Technical Lead', 'Technical Lead'],
-        'Skills': ['Project Management, Leadership', 'Project Management', 'Software Architecture', 'Software Architecture', 'AI/ML, Data Science']
-    }
-    
-    df = pd.DataFrame(data)
-    
-    # Add monthly hours columns for base year and option year one
-    base_year_periods = [
-        '03/13/2024-04/11/2024', '04/12/2024-05/11/2024', '05/12/2024-06/10/2024', '06/11/2024-07/10/2024',
-        '07/11/2024-08/09/2024', '08/10/2024-09/08/2024', '09/09/2024-10/08/2024', '10/09/2024-11/07/2024',
-        '11/08/2024-12/07/2024', '12/08/2024-01/06/2025', '01/07/2025-02/05/2025', '02/06/2025-03/07/2025'
-    ]
-    
-    option_year_periods = [
-        '03/08/2025-04/07/2025', '04/08/2025-05/07/2025', '05/08/2025-06/06/2025', '06/07/2025-07/06/2025',
-        '07/07/2025-08/05/2025', '08/06/2025-09/04/2025', '09/05/2025-10/04/2025', '10/05/2025-11/03/2025',
-        '11/04/2025-12/03/2025', '12/04/2025-01/02/2026', '01/03/2026-02/01/2026', '02/02/2026-03/03/2026'
-    ]
-    
-    # Add Hours and Revenue columns for all periods
-    for period in base_year_periods + option_year_periods:
-        df[f'Hours_{period}'] = 0.0
-        df[f'Revenue_{period}'] = 0.0
-    
     # Generate Excel file with multiple sheets
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+    with xlsxwriter.Workbook(output, {'in_memory': True}) as workbook:
+        header_format = workbook.add_format(_HEADER_FORMAT)
+        
         # Main data sheet
-        df.to_excel(writer, sheet_name='Employee_Data', index=False)
+        _write_employee_sheet(workbook, _COMPREHENSIVE_FIELDS, _COMPREHENSIVE_ROWS, header_format)
         
         # Instructions sheet
-        instructions = {
-            'Field': ['Name', 'LCAT', 'Priced_Salary', 'Current_Salary', 'Hours_Per_Month', 'Status', 'Department', 'Start_Date', 'Location', 'Manager', 'Skills'],
-            'Required': ['Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'Yes', 'No', 'No', 'No', 'No', 'No'],
-            'Description': [
-                'Full name of the employee',
-                'Labor Category (PM, SA/Eng Lead, AI Lead, etc.)',
-                'Original budgeted salary for the project',
-                'Current actual salary being paid',
-                'Standard hours worked per month (typically 173)',
-                'Employee status (Active or Inactive)',
-                'Department or team assignment',
-                'Employee start date (YYYY-MM-DD format)',
-                'Work location (Remote, On-site, Hybrid)',
-                'Direct manager or supervisor',
-                'Key skills and competencies (comma-separated)'
-            ]
-        }
-        
-        instructions_df = pd.DataFrame(instructions)
-        instructions_df.to_excel(writer, sheet_name='Instructions', index=False)
+        _write_sheet(workbook, 'Instructions', _INSTRUCTIONS_HEADER, _COMPREHENSIVE_INSTRUCTIONS, header_format)
         
         # Validation options sheet
-        max_length = max(8, 8, 4, 2)  # Max length of the arrays
-        
-        lcat_options = ['PM', 'SA/Eng Lead', 'AI Lead', 'HCD Lead', 'Scrum Master', 'Cloud Data Engineer', 'SRE', 'Full Stack Dev'] + [''] * (max_length - 8)
-        dept_options = ['Management', 'Engineering', 'AI/ML', 'Design', 'Agile', 'Data Engineering', 'DevOps', 'Business'] + [''] * (max_length - 8)
-        loc_options = ['Remote', 'On-site', 'Hybrid', 'Travel'] + [''] * (max_length - 4)
-        status_options = ['Active', 'Inactive'] + [''] * (max_length - 2)
-        
-        validation = {
-            'LCAT_Options': lcat_options,
-            'Department_Options': dept_options,
-            'Location_Options': loc_options,
-            'Status_Options': status_options
-        }
-        
-        validation_df = pd.DataFrame(validation)
-        validation_df.to_excel(writer, sheet_name='Validation_Options', index=False)
+        _write_columns(workbook, 'Validation_Options', _VALIDATION_OPTIONS, header_format)
     
-    output.seek(0)
     file_bytes = output.getvalue()
-    filename = f"employee_template_comprehensive_{datetime.now().strftime('%Y%m%d')}.xlsx"
+    filename = f"employee_template_comprehensive_{date_str}.xlsx"
     
     return file_bytes, filename
 
 def get_template_info() -> Dict[str, Any]:
     """Get information about available templates"""
     
-    return {
-        "basic": {
-            "name": "Basic Employee Template",
-            "description": "5 required fields + monthly hours/revenue columns",
-            "fields": 53,
-            "recommended_for": "Quick employee data entry"
-        },
-        "comprehensive": {
-            "name": "Comprehensive Employee Template", 
-            "description": "10 fields + monthly hours/revenue columns + instructions",
-            "fields": 58,
-            "recommended_for": "Detailed employee management"
-        }
-    }
+    return _TEMPLATE_INFO